@@ -2,111 +2,101 @@ import { PrismaClient } from '@prisma/client';
 
 const prisma = new PrismaClient();
 
-async function main() {
-  console.log('🌱 Seeding database...');
+// Default printers, INR per hour
+const printers = [
+  { id: 'printer-1', name: 'Prusa MK4', hourlyRate: 180 },
+  { id: 'printer-2', name: 'Creality Ender 3 V3', hourlyRate: 120 },
+  { id: 'printer-3', name: 'Bambu Lab X1C', hourlyRate: 250 },
+];
 
-  // Create default printers with filament pricing
-  const printer1 = await prisma.printer.upsert({
-    where: { id: 'printer-1' },
-    update: {},
-    create: {
-      id: 'printer-1',
-      name: 'Prusa MK4',
-      hourlyRate: 180, // INR per hour
-      filaments: {
-        create: [
-          {
-            id: 'printer-1-pla',
-            filamentType: 'pla',
-            name: 'PLA',
-            pricePerGram: 2.5,
-          },
-          {
-            id: 'printer-1-petg',
-            filamentType: 'petg',
-            name: 'PETG',
-            pricePerGram: 3.0,
-          },
-          {
-            id: 'printer-1-abs',
-            filamentType: 'abs',
-            name: 'ABS',
-            pricePerGram: 3.5,
-          },
-        ],
-      },
-    },
-  });
+// Filament pricing per printer, INR per gram
+const filaments = [
+  {
+    id: 'printer-1-pla',
+    printerId: 'printer-1',
+    filamentType: 'pla',
+    name: 'PLA',
+    pricePerGram: 2.5,
+  },
+  {
+    id: 'printer-1-petg',
+    printerId: 'printer-1',
+    filamentType: 'petg',
+    name: 'PETG',
+    pricePerGram: 3.0,
+  },
+  {
+    id: 'printer-1-abs',
+    printerId: 'printer-1',
+    filamentType: 'abs',
+    name: 'ABS',
+    pricePerGram: 3.5,
+  },
+  {
+    id: 'printer-2-pla',
+    printerId: 'printer-2',
+    filamentType: 'pla',
+    name: 'PLA',
+    pricePerGram: 2.0,
+  },
+  {
+    id: 'printer-2-petg',
+    printerId: 'printer-2',
+    filamentType: 'petg',
+    name: 'PETG',
+    pricePerGram: 2.5,
+  },
+  {
+    id: 'printer-3-pla',
+    printerId: 'printer-3',
+    filamentType: 'pla',
+    name: 'PLA',
+    pricePerGram: 3.0,
+  },
+  {
+    id: 'printer-3-petg',
+    printerId: 'printer-3',
+    filamentType: 'petg',
+    name: 'PETG',
+    pricePerGram: 3.5,
+  },
+  {
+    id: 'printer-3-abs',
+    printerId: 'printer-3',
+    filamentType: 'abs',
+    name: 'ABS',
+    pricePerGram: 4.0,
+  },
+  {
+    id: 'printer-3-tpu',
+    printerId: 'printer-3',
+    filamentType: 'tpu',
+    name: 'TPU',
+    pricePerGram: 5.0,
+  },
+];
 
-  const printer2 = await prisma.printer.upsert({
-    where: { id: 'printer-2' },
-    update: {},
-    create: {
-      id: 'printer-2',
-      name: 'Creality Ender 3 V3',
-      hourlyRate: 120, // INR per hour
-      filaments: {
-        create: [
-          {
-            id: 'printer-2-pla',
-            filamentType: 'pla',
-            name: 'PLA',
-            pricePerGram: 2.0,
-          },
-          {
-            id: 'printer-2-petg',
-            filamentType: 'petg',
-            name: 'PETG',
-            pricePerGram: 2.5,
-          },
-        ],
-      },
-    },
-  });
+async function main() {
+  console.log('🌱 Seeding database...');
 
-  const printer3 = await prisma.printer.upsert({
-    where: { id: 'printer-3' },
-    update: {},
-    create: {
-      id: 'printer-3',
-      name: 'Bambu Lab X1C',
-      hourlyRate: 250, // INR per hour
-      filaments: {
-        create: [
-          {
-            id: 'printer-3-pla',
-            filamentType: 'pla',
-            name: 'PLA',
-            pricePerGram: 3.0,
-          },
-          {
-            id: 'printer-3-petg',
-            filamentType: 'petg',
-            name: 'PETG',
-            pricePerGram: 3.5,
-          },
-          {
-            id: 'printer-3-abs',
-            filamentType: 'abs',
-            name: 'ABS',
-            pricePerGram: 4.0,
-          },
-          {
-            id: 'printer-3-tpu',
-            filamentType: 'tpu',
-            name: 'TPU',
-            pricePerGram: 5.0,
-          },
-        ],
-      },
-    },
-  });
+  // IDs are fixed up front, so printers and their filaments can each be
+  // written with one multi-row insert. skipDuplicates maps to
+  // ON CONFLICT DO NOTHING, so re-runs leave existing rows untouched
+  // without probing for them first
+  const [createdPrinters, createdFilaments] = await prisma.$transaction([
+    prisma.printer.createMany({ data: printers, skipDuplicates: true }),
+    prisma.filamentPricing.createMany({
+      data: filaments,
+      skipDuplicates: true,
+    }),
+  ]);
 
-  console.log('✅ Created printers:', {
-    printer1: printer1.name,
-    printer2: printer2.name,
-    printer3: printer3.name,
-  });
+  console.log(
+    `✅ Printers: ${createdPrinters.count} created, ${printers.length - createdPrinters.count} already present`,
+  );
+  console.log(
+    `✅ Filaments: ${createdFilaments.count} created, ${filaments.length - createdFilaments.count} already present`,
+  );
 
   console.log('🎉 Seeding complete!');
 }
@@ -119,4 +109,3 @@ main()
   .finally(async () => {
     await prisma.$disconnect();
   });
-
@@ -4,6 +4,11 @@ import { ApiTags, ApiOperation, ApiResponse } from '@nestjs/swagger';
 @ApiTags('Health')
 @Controller()
 export class AppController {
+  // Health probes arrive far more often than once a second; reuse the
+  // formatted timestamp for the rest of the current second
+  private timestampSecond = -1;
+  private timestamp = '';
+
   @Get('ping')
   @ApiOperation({
     summary: 'Ping',
@@ -21,6 +26,15 @@ export class AppController {
   })
   @ApiResponse({ status: 200, description: 'API is healthy' })
   health() {
-    return { status: 'ok', timestamp: new Date().toISOString() };
+    return { status: 'ok', timestamp: this.currentTimestamp() };
+  }
+
+  private currentTimestamp(): string {
+    const second = Math.floor(Date.now() / 1000);
+    if (second !== this.timestampSecond) {
+      this.timestampSecond = second;
+      this.timestamp = new Date(second * 1000).toISOString();
+    }
+    return this.timestamp;
   }
 }
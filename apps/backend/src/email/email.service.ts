@@ -15,6 +15,49 @@ interface OrderWithRelations {
   filament: { name: string };
 }
 
+// Per-status copy shared by the subject, plain-text and HTML templates
+const STATUS_SUBJECTS: Record<OrderStatus, string> = {
+  PLACED: 'Your order has been placed',
+  PRINTING: 'Your print has started! 🖨️',
+  READY: 'Your print is ready for pickup! 🎉',
+  COMPLETED: 'Your order has been completed',
+  CANCELLED: 'Your order has been cancelled',
+};
+
+const STATUS_EMOJI: Record<OrderStatus, string> = {
+  PLACED: '📋',
+  PRINTING: '🖨️',
+  READY: '✅',
+  COMPLETED: '🎉',
+  CANCELLED: '❌',
+};
+
+const STATUS_MESSAGES: Record<OrderStatus, string> = {
+  PLACED: 'Your order is in the queue.',
+  PRINTING: 'Your model is now being printed!',
+  READY: 'Your print is complete and ready for pickup!',
+  COMPLETED: 'Your order has been marked as completed. Thanks!',
+  CANCELLED:
+    'Your order has been cancelled. Please contact us if you have questions.',
+};
+
+const STATUS_COLORS: Record<OrderStatus, string> = {
+  PLACED: '#3b82f6',
+  PRINTING: '#8b5cf6',
+  READY: '#10b981',
+  COMPLETED: '#10b981',
+  CANCELLED: '#ef4444',
+};
+
+const HTML_ESCAPES: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#039;',
+};
+const HTML_ESCAPE_PATTERN = /[&<>"']/g;
+
 @Injectable()
 export class EmailService {
   private readonly logger = new Logger(EmailService.name);
@@ -62,15 +105,7 @@ export class EmailService {
     order: OrderWithRelations,
     previousStatus: OrderStatus,
   ): Promise<void> {
-    const statusMessages: Record<OrderStatus, string> = {
-      PLACED: 'Your order has been placed',
-      PRINTING: 'Your print has started! 🖨️',
-      READY: 'Your print is ready for pickup! 🎉',
-      COMPLETED: 'Your order has been completed',
-      CANCELLED: 'Your order has been cancelled',
-    };
-
-    const subject = `Swift Prints: ${statusMessages[order.status]}`;
+    const subject = `Swift Prints: ${STATUS_SUBJECTS[order.status]}`;
     const htmlBody = this.buildStatusUpdateEmailHTML(order, previousStatus);
     const textBody = this.buildStatusUpdateEmail(order, previousStatus);
 
@@ -157,23 +192,6 @@ Thanks for using Swift Prints! 🚀
     order: OrderWithRelations,
     previousStatus: OrderStatus,
   ): string {
-    const statusEmoji: Record<OrderStatus, string> = {
-      PLACED: '📋',
-      PRINTING: '🖨️',
-      READY: '✅',
-      COMPLETED: '🎉',
-      CANCELLED: '❌',
-    };
-
-    const statusMessage: Record<OrderStatus, string> = {
-      PLACED: 'Your order is in the queue.',
-      PRINTING: 'Your model is now being printed!',
-      READY: 'Your print is complete and ready for pickup!',
-      COMPLETED: 'Your order has been marked as completed. Thanks!',
-      CANCELLED:
-        'Your order has been cancelled. Please contact us if you have questions.',
-    };
-
     return `
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 🖨️ SWIFT PRINTS - STATUS UPDATE
@@ -183,9 +201,9 @@ Hi ${order.participantName}!
 
 Your order status has been updated:
 
-${previousStatus} ➜ ${statusEmoji[order.status]} ${order.status}
+${previousStatus} ➜ ${STATUS_EMOJI[order.status]} ${order.status}
 
-${statusMessage[order.status]}
+${STATUS_MESSAGES[order.status]}
 
 ORDER DETAILS
 ━━━━━━━━━━━━━
@@ -277,34 +295,9 @@ Team:         ${order.teamNumber}
     order: OrderWithRelations,
     previousStatus: OrderStatus,
   ): string {
-    const statusEmoji: Record<OrderStatus, string> = {
-      PLACED: '📋',
-      PRINTING: '🖨️',
-      READY: '✅',
-      COMPLETED: '🎉',
-      CANCELLED: '❌',
-    };
-
-    const statusMessage: Record<OrderStatus, string> = {
-      PLACED: 'Your order is in the queue.',
-      PRINTING: 'Your model is now being printed!',
-      READY: 'Your print is complete and ready for pickup!',
-      COMPLETED: 'Your order has been marked as completed. Thanks!',
-      CANCELLED:
-        'Your order has been cancelled. Please contact us if you have questions.',
-    };
-
-    const statusColors: Record<OrderStatus, string> = {
-      PLACED: '#3b82f6',
-      PRINTING: '#8b5cf6',
-      READY: '#10b981',
-      COMPLETED: '#10b981',
-      CANCELLED: '#ef4444',
-    };
-
-    const currentColor = statusColors[order.status];
-    const emoji = statusEmoji[order.status];
-    const message = statusMessage[order.status];
+    const currentColor = STATUS_COLORS[order.status];
+    const emoji = STATUS_EMOJI[order.status];
+    const message = STATUS_MESSAGES[order.status];
 
     return `
 <!DOCTYPE html>
@@ -376,13 +369,6 @@ Team:         ${order.teamNumber}
    * Escape HTML special characters to prevent XSS
    */
   private escapeHtml(text: string): string {
-    const map: Record<string, string> = {
-      '&': '&amp;',
-      '<': '&lt;',
-      '>': '&gt;',
-      '"': '&quot;',
-      "'": '&#039;',
-    };
-    return text.replace(/[&<>"']/g, (m) => map[m]);
+    return text.replace(HTML_ESCAPE_PATTERN, (m) => HTML_ESCAPES[m]);
   }
 }
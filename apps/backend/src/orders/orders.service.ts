@@ -34,14 +34,11 @@ export class OrdersService {
 
     this.logger.log(`Creating order ${orderId} for team ${dto.teamNumber}`);
 
-    // Get upload data for base estimates
-    const upload = await this.uploads.getById(dto.uploadId);
-
-    // Validate printer and filament
-    const { printer, filament } = await this.printers.validatePrinterFilament(
-      dto.printerId,
-      dto.filamentId,
-    );
+    // Get upload data for base estimates and validate printer and filament
+    const [upload, { printer, filament }] = await Promise.all([
+      this.uploads.getById(dto.uploadId),
+      this.printers.validatePrinterFilament(dto.printerId, dto.filamentId),
+    ]);
 
     // Calculate cost from base estimates
     const materialCost = upload.baseFilamentEstimateG * filament.pricePerGram;
@@ -97,6 +94,22 @@ export class OrdersService {
     return order;
   }
 
+  /**
+   * Get only an order's current status, without loading its relations
+   */
+  private async getStatus(orderId: string): Promise<OrderStatus> {
+    const order = await this.prisma.order.findUnique({
+      where: { id: orderId },
+      select: { status: true },
+    });
+
+    if (!order) {
+      throw new NotFoundException(`Order ${orderId} not found`);
+    }
+
+    return order.status;
+  }
+
   /**
    * Get all orders (for admin)
    */
@@ -119,8 +132,7 @@ export class OrdersService {
    * Update order status (admin only)
    */
   async updateStatus(orderId: string, status: OrderStatus) {
-    const order = await this.findById(orderId);
-    const previousStatus = order.status;
+    const previousStatus = await this.getStatus(orderId);
 
     const updated = await this.prisma.order.update({
       where: { id: orderId },
@@ -146,16 +158,15 @@ export class OrdersService {
    * Cancel an order (participant can cancel if status is PLACED or PRINTING)
    */
   async cancelOrder(orderId: string) {
-    const order = await this.findById(orderId);
-    const previousStatus = order.status;
+    const previousStatus = await this.getStatus(orderId);
 
     // Only allow cancellation if order is PLACED or PRINTING
     if (
-      order.status !== OrderStatus.PLACED &&
-      order.status !== OrderStatus.PRINTING
+      previousStatus !== OrderStatus.PLACED &&
+      previousStatus !== OrderStatus.PRINTING
     ) {
       throw new BadRequestException(
-        `Cannot cancel order with status ${order.status}. Only PLACED or PRINTING orders can be cancelled.`,
+        `Cannot cancel order with status ${previousStatus}. Only PLACED or PRINTING orders can be cancelled.`,
       );
     }
 
@@ -27,15 +27,14 @@ export class PricingService {
    * Get a detailed price estimate by slicing the model
    */
   async getEstimate(dto: EstimateRequestDto): Promise<EstimateResponseDto> {
-    // Validate printer and filament
-    const { printer, filament } =
-      await this.printersService.validatePrinterFilament(
+    // Validate printer and filament while looking up the upload
+    const [{ printer, filament }, upload] = await Promise.all([
+      this.printersService.validatePrinterFilament(
         dto.printerId,
         dto.filamentId,
-      );
-
-    // Download the STL file
-    const stlBuffer = await this.uploadsService.downloadStl(dto.uploadId);
+      ),
+      this.uploadsService.getById(dto.uploadId),
+    ]);
 
     // Slice the model
     const sliceOptions: SliceOptions = {
@@ -44,7 +43,11 @@ export class PricingService {
       supports: dto.supports || 'auto',
     };
 
-    const sliceResult = await this.slicingService.slice(stlBuffer, sliceOptions);
+    // Stream the STL from storage into the slicer job
+    const sliceResult = await this.slicingService.sliceStoredFile(
+      upload.stlKey,
+      sliceOptions,
+    );
 
     // Calculate costs
     const materialCost = sliceResult.filamentUsedGrams * filament.pricePerGram;
@@ -98,12 +101,11 @@ export class PricingService {
     printerId: string,
     filamentId: string,
   ): Promise<EstimateResponseDto> {
-    // Get upload data
-    const upload = await this.uploadsService.getById(uploadId);
-
-    // Validate printer and filament
-    const { printer, filament } =
-      await this.printersService.validatePrinterFilament(printerId, filamentId);
+    // Get upload data and validate printer and filament together
+    const [upload, { printer, filament }] = await Promise.all([
+      this.uploadsService.getById(uploadId),
+      this.printersService.validatePrinterFilament(printerId, filamentId),
+    ]);
 
     // Use base estimates from upload analysis
     const price = this.calculatePrice(
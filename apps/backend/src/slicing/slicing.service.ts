@@ -2,8 +2,10 @@ import { Injectable, Logger, BadRequestException } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { spawn } from 'child_process';
 import * as fs from 'fs/promises';
+import * as os from 'os';
 import * as path from 'path';
 import { v4 as uuidv4 } from 'uuid';
+import { StorageService } from '../storage/storage.service';
 
 export interface SliceOptions {
   layerHeight: number;
@@ -17,13 +19,32 @@ export interface SliceResult {
   printTimeHours: number;
 }
 
+// PrusaSlicer G-code metadata comments
+const FILAMENT_MM_PATTERN = /;\s*filament used \[mm\]\s*=\s*([\d.]+)/i;
+const FILAMENT_G_PATTERN = /;\s*filament used \[g\]\s*=\s*([\d.]+)/i;
+const ESTIMATED_TIME_PATTERN =
+  /;\s*estimated printing time.*=\s*(?:(\d+)d\s*)?(?:(\d+)h\s*)?(?:(\d+)m\s*)?(?:(\d+)s)?/i;
+const TIME_SECONDS_PATTERN = /^;TIME:(\d+)/i;
+const PRINT_TIME_PATTERN = /;\s*Print time:\s*(\d+)/i;
+
 @Injectable()
 export class SlicingService {
   private readonly logger = new Logger(SlicingService.name);
   private readonly jobsPath: string;
   private readonly configPath: string;
-
-  constructor(private configService: ConfigService) {
+  private readonly STDERR_TAIL_LINES = 200;
+  private readonly STDERR_MAX_LINE_LENGTH = 4096;
+  private readonly configFile: string;
+
+  // PrusaSlicer is CPU bound; run at most one process per core and queue the rest
+  private readonly maxConcurrentSlices: number;
+  private activeSlices = 0;
+  private readonly sliceQueue: Array<() => void> = [];
+
+  constructor(
+    private configService: ConfigService,
+    private storage: StorageService,
+  ) {
     this.jobsPath = this.configService.get<string>(
       'SLICER_JOBS_PATH',
       '/tmp/slicer_jobs',
@@ -32,15 +53,26 @@ export class SlicingService {
       'SLICER_CONFIG_PATH',
       '/config',
     );
+    this.configFile = path.join(this.configPath, 'config_pla.ini');
+    const maxConcurrency = parseInt(
+      this.configService.get<string>('SLICER_MAX_CONCURRENCY', ''),
+      10,
+    );
+    this.maxConcurrentSlices =
+      maxConcurrency > 0 ? maxConcurrency : Math.max(1, os.cpus().length);
 
     this.logger.log(`Slicer jobs path: ${this.jobsPath}`);
     this.logger.log(`Slicer config path: ${this.configPath}`);
+    this.logger.log(`Slicer concurrency: ${this.maxConcurrentSlices}`);
   }
 
   /**
-   * Slice an STL file using PrusaSlicer
+   * Slice an STL file held in storage, streaming it straight into the job directory
    */
-  async slice(stlBuffer: Buffer, options: SliceOptions): Promise<SliceResult> {
+  async sliceStoredFile(
+    stlKey: string,
+    options: SliceOptions,
+  ): Promise<SliceResult> {
     const jobId = uuidv4();
     const jobDir = path.join(this.jobsPath, jobId);
     const stlPath = path.join(jobDir, 'input.stl');
@@ -51,15 +83,20 @@ export class SlicingService {
       await fs.mkdir(jobDir, { recursive: true });
 
       // Write STL file
-      await fs.writeFile(stlPath, stlBuffer);
+      await this.storage.downloadToFile(stlKey, stlPath);
 
       this.logger.log(`Starting slice job: ${jobId}`);
 
       // Build slicer command
       const args = this.buildSlicerArgs(stlPath, gcodePath, options);
 
-      // Run PrusaSlicer
-      await this.runSlicer(args, jobDir);
+      // Run PrusaSlicer once a slot is free
+      await this.acquireSliceSlot();
+      try {
+        await this.runSlicer(args, jobDir);
+      } finally {
+        this.releaseSliceSlot();
+      }
 
       // Read G-code file
       const gcodeBuffer = await fs.readFile(gcodePath);
@@ -86,6 +123,24 @@ export class SlicingService {
     }
   }
 
+  private async acquireSliceSlot(): Promise<void> {
+    if (this.activeSlices < this.maxConcurrentSlices) {
+      this.activeSlices++;
+      return;
+    }
+    await new Promise<void>((resolve) => this.sliceQueue.push(resolve));
+  }
+
+  private releaseSliceSlot(): void {
+    // Hand the slot straight to the next waiting job, if any
+    const next = this.sliceQueue.shift();
+    if (next) {
+      next();
+    } else {
+      this.activeSlices--;
+    }
+  }
+
   private buildSlicerArgs(
     stlPath: string,
     gcodePath: string,
@@ -117,7 +172,7 @@ export class SlicingService {
     }
 
     // Add config file
-    args.push('--load', path.join(this.configPath, 'config_pla.ini'));
+    args.push('--load', this.configFile);
 
     // Input file
     args.push(stlPath);
@@ -136,17 +191,45 @@ export class SlicingService {
         stdio: ['ignore', 'pipe', 'pipe'],
       });
 
-      let stderr = '';
+      // Timeout after 5 minutes
+      const timeout = setTimeout(
+        () => {
+          slicerProcess.kill();
+          reject(new BadRequestException('Slicing timed out'));
+        },
+        5 * 60 * 1000,
+      );
+
+      // Keep only the last lines of stderr for error reporting so chatty
+      // slicer runs don't grow memory without bound
+      const stderrTail: string[] = [];
+      let partialLine = '';
+      const pushStderrLine = (line: string) => {
+        stderrTail.push(line);
+        if (stderrTail.length > this.STDERR_TAIL_LINES) {
+          stderrTail.shift();
+        }
+      };
 
       slicerProcess.stdout?.on('data', (data) => {
         this.logger.debug(`Slicer stdout: ${data.toString()}`);
       });
 
-      slicerProcess.stderr?.on('data', (data) => {
-        stderr += data.toString();
+      slicerProcess.stderr?.setEncoding('utf-8');
+      slicerProcess.stderr?.on('data', (data: string) => {
+        const lines = (partialLine + data).split('\n');
+        // Carriage-return progress output may never end a line; cap what we hold
+        partialLine = (lines.pop() ?? '').slice(-this.STDERR_MAX_LINE_LENGTH);
+        lines.forEach(pushStderrLine);
       });
 
       slicerProcess.on('close', (code) => {
+        clearTimeout(timeout);
+        if (partialLine) {
+          pushStderrLine(partialLine);
+        }
+        const stderr = stderrTail.join('\n');
+
         if (code === 0) {
           resolve();
         } else {
@@ -160,18 +243,10 @@ export class SlicingService {
       });
 
       slicerProcess.on('error', (err) => {
+        clearTimeout(timeout);
         this.logger.error(`Slicer process error: ${err.message}`);
         reject(new BadRequestException(`Slicing failed: ${err.message}`));
       });
-
-      // Timeout after 5 minutes
-      setTimeout(
-        () => {
-          slicerProcess.kill();
-          reject(new BadRequestException('Slicing timed out'));
-        },
-        5 * 60 * 1000,
-      );
     });
   }
 
@@ -183,30 +258,33 @@ export class SlicingService {
     let filamentUsedGrams: number | null = null;
     let printTimeSeconds = 0;
 
-    // Parse PrusaSlicer G-code comments
-    const lines = gcode.split('\n');
-    for (const line of lines) {
+    // Parse PrusaSlicer G-code comments. Every pattern needs a ';', so only
+    // lines containing one are matched; move lines are skipped unsplit
+    let nextSemicolon = gcode.indexOf(';');
+    while (nextSemicolon !== -1) {
+      const lineStart = gcode.lastIndexOf('\n', nextSemicolon) + 1;
+      let lineEnd = gcode.indexOf('\n', nextSemicolon);
+      if (lineEnd === -1) {
+        lineEnd = gcode.length;
+      }
+      const line = gcode.slice(lineStart, lineEnd);
+      nextSemicolon = gcode.indexOf(';', lineEnd);
+
       // Filament used in mm
-      const filamentMatch = line.match(
-        /;\s*filament used \[mm\]\s*=\s*([\d.]+)/i,
-      );
+      const filamentMatch = FILAMENT_MM_PATTERN.exec(line);
       if (filamentMatch) {
         filamentUsedMm = parseFloat(filamentMatch[1]);
       }
 
       // Filament used in grams (preferred)
-      const filamentGMatch = line.match(
-        /;\s*filament used \[g\]\s*=\s*([\d.]+)/i,
-      );
+      const filamentGMatch = FILAMENT_G_PATTERN.exec(line);
       if (filamentGMatch) {
         filamentUsedGrams = parseFloat(filamentGMatch[1]);
       }
 
       // Estimated print time - try multiple formats
       // Format 1: "estimated printing time (normal mode) = 1h 23m 45s"
-      const timeMatch = line.match(
-        /;\s*estimated printing time.*=\s*(?:(\d+)d\s*)?(?:(\d+)h\s*)?(?:(\d+)m\s*)?(?:(\d+)s)?/i,
-      );
+      const timeMatch = ESTIMATED_TIME_PATTERN.exec(line);
       if (timeMatch) {
         const days = parseInt(timeMatch[1] || '0');
         const hours = parseInt(timeMatch[2] || '0');
@@ -216,13 +294,13 @@ export class SlicingService {
       }
 
       // Format 2: ";TIME:12345" (seconds)
-      const timeSecsMatch = line.match(/^;TIME:(\d+)/i);
+      const timeSecsMatch = TIME_SECONDS_PATTERN.exec(line);
       if (timeSecsMatch && printTimeSeconds === 0) {
         printTimeSeconds = parseInt(timeSecsMatch[1]);
       }
 
       // Format 3: ";Print time: 12345" (seconds)
-      const printTimeMatch = line.match(/;\s*Print time:\s*(\d+)/i);
+      const printTimeMatch = PRINT_TIME_PATTERN.exec(line);
       if (printTimeMatch && printTimeSeconds === 0) {
         printTimeSeconds = parseInt(printTimeMatch[1]);
       }
@@ -1,3 +1,3 @@
 export * from './storage.module';
 export * from './storage.service';
-
+export * from './s3-presigner';
@@ -6,14 +6,19 @@ import {
   GetObjectCommand,
   DeleteObjectCommand,
 } from '@aws-sdk/client-s3';
-import { getSignedUrl } from '@aws-sdk/s3-request-presigner';
+import { createWriteStream } from 'fs';
 import { Readable } from 'stream';
+import { pipeline } from 'stream/promises';
+import { S3Presigner } from './s3-presigner';
 
 @Injectable()
 export class StorageService {
   private readonly logger = new Logger(StorageService.name);
   private readonly s3Client: S3Client;
   private readonly bucket: string;
+  private readonly presigner: S3Presigner | null;
+  private readonly internalOrigin: string | null = null;
+  private readonly publicOrigin: string | null = null;
 
   constructor(private configService: ConfigService) {
     const endpoint = this.configService.get<string>('S3_ENDPOINT');
@@ -33,6 +38,31 @@ export class StorageService {
       forcePathStyle: !!endpoint, // Use path-style for LocalStack, virtual-hosted for AWS S3
     });
 
+    // Sign URLs locally unless explicitly disabled; falls back to the SDK presigner
+    const localPresign =
+      this.configService.get<string>('S3_LOCAL_PRESIGN', 'true') !== 'false';
+    this.presigner = localPresign
+      ? new S3Presigner({
+          accessKeyId: accessKey,
+          secretAccessKey: secretKey,
+          region,
+          bucket: this.bucket,
+          endpoint: endpoint || undefined,
+        })
+      : null;
+
+    // For LocalStack, signed URLs point at the internal endpoint; resolve the
+    // public origin to swap in once here instead of on every signed URL
+    const publicEndpoint = this.configService.get<string>('S3_PUBLIC_ENDPOINT');
+    if (publicEndpoint && endpoint) {
+      try {
+        this.internalOrigin = new URL(endpoint).origin;
+        this.publicOrigin = new URL(publicEndpoint).origin;
+      } catch (error) {
+        this.logger.warn(`Invalid S3 endpoint configuration: ${error.message}`);
+      }
+    }
+
     const storageType = endpoint ? 'LocalStack' : 'AWS S3';
     this.logger.log(
       `Storage initialized: ${storageType} (${endpoint || region})`,
@@ -68,41 +98,29 @@ export class StorageService {
     expiresIn: number = 3600,
     filename?: string,
   ): Promise<string> {
-    const command = new GetObjectCommand({
-      Bucket: this.bucket,
-      Key: key,
-      ...(filename && {
-        ResponseContentDisposition: `attachment; filename="${filename}"`,
-      }),
-    });
-
-    const url = await getSignedUrl(this.s3Client, command, { expiresIn });
-
-    // For LocalStack, replace internal endpoint with public endpoint if configured
-    const publicEndpoint = this.configService.get<string>('S3_PUBLIC_ENDPOINT');
-    const internalEndpoint = this.configService.get<string>('S3_ENDPOINT');
-
-    if (publicEndpoint && internalEndpoint) {
-      try {
-        const urlObj = new URL(url);
-        const internalUrlObj = new URL(internalEndpoint);
-        const publicUrlObj = new URL(publicEndpoint);
-
-        // Replace host if it matches the internal endpoint
-        if (
-          urlObj.hostname === internalUrlObj.hostname ||
-          urlObj.host === internalUrlObj.host
-        ) {
-          urlObj.host = publicUrlObj.host;
-          urlObj.protocol = publicUrlObj.protocol;
-          return urlObj.toString();
-        }
-      } catch (error) {
-        this.logger.warn(`Failed to replace endpoint in URL: ${error.message}`);
-      }
-    }
-
-    return url;
+    const contentDisposition = filename
+      ? `attachment; filename="${filename}"`
+      : undefined;
+
+    const url = this.presigner
+      ? this.presigner.presign({
+          method: 'GET',
+          key,
+          expiresIn,
+          query: contentDisposition
+            ? { 'response-content-disposition': contentDisposition }
+            : undefined,
+        })
+      : await this.sdkSignedUrl(
+          new GetObjectCommand({
+            Bucket: this.bucket,
+            Key: key,
+            ResponseContentDisposition: contentDisposition,
+          }),
+          expiresIn,
+        );
+
+    return this.toPublicUrl(url);
   }
 
   /**
@@ -113,54 +131,31 @@ export class StorageService {
     contentType: string,
     expiresIn: number = 3600,
   ): Promise<string> {
-    const command = new PutObjectCommand({
-      Bucket: this.bucket,
-      Key: key,
-      ContentType: contentType,
-    });
-
-    const url = await getSignedUrl(this.s3Client, command, { expiresIn });
-
-    // For LocalStack, replace internal endpoint with public endpoint if configured
-    const publicEndpoint = this.configService.get<string>('S3_PUBLIC_ENDPOINT');
-    const internalEndpoint = this.configService.get<string>('S3_ENDPOINT');
-
-    if (publicEndpoint && internalEndpoint) {
-      try {
-        const urlObj = new URL(url);
-        const internalUrlObj = new URL(internalEndpoint);
-        const publicUrlObj = new URL(publicEndpoint);
-
-        // Replace host if it matches the internal endpoint
-        if (
-          urlObj.hostname === internalUrlObj.hostname ||
-          urlObj.host === internalUrlObj.host
-        ) {
-          urlObj.host = publicUrlObj.host;
-          urlObj.protocol = publicUrlObj.protocol;
-          return urlObj.toString();
-        }
-      } catch (error) {
-        this.logger.warn(`Failed to replace endpoint in URL: ${error.message}`);
-      }
-    }
-
-    return url;
+    const url = this.presigner
+      ? this.presigner.presign({ method: 'PUT', key, expiresIn, contentType })
+      : await this.sdkSignedUrl(
+          new PutObjectCommand({
+            Bucket: this.bucket,
+            Key: key,
+            ContentType: contentType,
+          }),
+          expiresIn,
+        );
+
+    return this.toPublicUrl(url);
   }
 
   /**
-   * Download a file from S3
+   * Stream a file from S3 straight to a local path without buffering it
    */
-  async downloadFile(key: string): Promise<Buffer> {
+  async downloadToFile(key: string, filePath: string): Promise<void> {
     const command = new GetObjectCommand({
       Bucket: this.bucket,
       Key: key,
     });
 
     const response = await this.s3Client.send(command);
-    const stream = response.Body as Readable;
-
-    return this.streamToBuffer(stream);
+    await pipeline(response.Body as Readable, createWriteStream(filePath));
   }
 
   /**
@@ -190,11 +185,28 @@ export class StorageService {
     return `orders/${orderId}/output.gcode`;
   }
 
-  private async streamToBuffer(stream: Readable): Promise<Buffer> {
-    const chunks: Buffer[] = [];
-    for await (const chunk of stream) {
-      chunks.push(chunk);
+  /**
+   * Presign through the AWS SDK; only loaded when local presigning is disabled
+   */
+  private async sdkSignedUrl(
+    command: GetObjectCommand | PutObjectCommand,
+    expiresIn: number,
+  ): Promise<string> {
+    const { getSignedUrl } = await import('@aws-sdk/s3-request-presigner');
+    return getSignedUrl(this.s3Client, command, { expiresIn });
+  }
+
+  /**
+   * Replace the internal endpoint origin with the public one, if configured
+   */
+  private toPublicUrl(url: string): string {
+    if (
+      this.internalOrigin &&
+      this.publicOrigin &&
+      url.startsWith(`${this.internalOrigin}/`)
+    ) {
+      return this.publicOrigin + url.slice(this.internalOrigin.length);
     }
-    return Buffer.concat(chunks);
+    return url;
   }
 }
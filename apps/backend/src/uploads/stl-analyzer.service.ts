@@ -115,26 +115,28 @@ export class StlAnalyzerService {
       return analysis;
     }
 
-    const triangleCount = buffer.readUInt32LE(80);
+    // One little-endian view over the whole file instead of bounds-checked
+    // Buffer reads per float; triangles are 50 bytes so records are unaligned
+    const view = new DataView(buffer.buffer, buffer.byteOffset, buffer.length);
+    const triangleCount = Math.min(
+      view.getUint32(80, true),
+      Math.floor((buffer.length - 84) / 50),
+    );
     let offset = 84;
 
     for (let i = 0; i < triangleCount; i++) {
-      if (offset + 50 > buffer.length) {
-        break;
-      }
-
       this.accumulateTriangle(
         analysis,
-        buffer.readFloatLE(offset + 8),
-        buffer.readFloatLE(offset + 12),
-        buffer.readFloatLE(offset + 16),
-        buffer.readFloatLE(offset + 20),
-        buffer.readFloatLE(offset + 24),
-        buffer.readFloatLE(offset + 28),
-        buffer.readFloatLE(offset + 32),
-        buffer.readFloatLE(offset + 36),
-        buffer.readFloatLE(offset + 40),
-        buffer.readFloatLE(offset + 44),
+        view.getFloat32(offset + 8, true),
+        view.getFloat32(offset + 12, true),
+        view.getFloat32(offset + 16, true),
+        view.getFloat32(offset + 20, true),
+        view.getFloat32(offset + 24, true),
+        view.getFloat32(offset + 28, true),
+        view.getFloat32(offset + 32, true),
+        view.getFloat32(offset + 36, true),
+        view.getFloat32(offset + 40, true),
+        view.getFloat32(offset + 44, true),
       );
 
       offset += 50; // 12 floats (48 bytes) + 2 byte attribute
@@ -19,6 +19,9 @@ import {
 import { UploadsService } from './uploads.service';
 import { UploadResponseDto } from './dto/upload-response.dto';
 
+const STL_EXTENSION = '.stl';
+const STL_MIME_TYPES = new Set(['application/sla', 'model/stl']);
+
 @ApiTags('Uploads')
 @Controller('uploads')
 export class UploadsController {
@@ -59,11 +62,10 @@ export class UploadsController {
         fileSize: 50 * 1024 * 1024, // 50MB max
       },
       fileFilter: (req, file, callback) => {
-        if (
-          !file.originalname.toLowerCase().endsWith('.stl') &&
-          file.mimetype !== 'application/sla' &&
-          file.mimetype !== 'model/stl'
-        ) {
+        const extension = file.originalname
+          .slice(file.originalname.lastIndexOf('.'))
+          .toLowerCase();
+        if (extension !== STL_EXTENSION && !STL_MIME_TYPES.has(file.mimetype)) {
           callback(
             new BadRequestException('Only STL files are allowed'),
             false,
@@ -89,13 +89,5 @@ export class UploadsService {
     const upload = await this.getById(uploadId);
     return this.storage.getSignedDownloadUrl(upload.stlKey, 3600, filename);
   }
-
-  /**
-   * Download the STL file buffer for an upload
-   */
-  async downloadStl(uploadId: string): Promise<Buffer> {
-    const upload = await this.getById(uploadId);
-    return this.storage.downloadFile(upload.stlKey);
-  }
 }
 
@@ -69,7 +69,9 @@ export function useRealTimeService(options: RealTimeServiceOptions = {}) {
         handleAnalysisUpdate(data.data);
         break;
       default:
-        console.log("Unknown WebSocket message type:", data.type);
+        if (process.env.NODE_ENV === "development") {
+          console.log("Unknown WebSocket message type:", data.type);
+        }
     }
   }, []); // eslint-disable-line react-hooks/exhaustive-deps
 
@@ -170,24 +172,27 @@ export function useRealTimeService(options: RealTimeServiceOptions = {}) {
 
       // Poll pricing updates
       if (subscribedPricingRef.current.size > 0) {
-        const pricingParams = Array.from(subscribedPricingRef.current);
-        const pricingPromises = pricingParams.map((paramsKey) => {
-          try {
-            const params = JSON.parse(paramsKey);
-            return apiClient.post<PricingBreakdown>(
-              "/api/pricing/calculate",
-              params
-            );
-          } catch (error) {
-            return Promise.reject(error);
+        // Decode each subscription key once and reuse it for the response
+        const pricingParams: (PricingParams | null)[] = Array.from(
+          subscribedPricingRef.current,
+          (paramsKey) => {
+            try {
+              return JSON.parse(paramsKey);
+            } catch {
+              return null;
+            }
           }
-        });
+        );
+        const pricingPromises = pricingParams.map((params) =>
+          params
+            ? apiClient.post<PricingBreakdown>("/api/pricing/calculate", params)
+            : Promise.reject(new Error("Invalid pricing subscription"))
+        );
 
         const pricingResults = await Promise.allSettled(pricingPromises);
         pricingResults.forEach((result, index) => {
-          if (result.status === "fulfilled") {
-            const paramsKey = pricingParams[index];
-            const params = JSON.parse(paramsKey);
+          const params = pricingParams[index];
+          if (result.status === "fulfilled" && params) {
             const pricing = result.value.data;
             handlePricingUpdate({ params, pricing });
           }